@@ -1,8 +1,18 @@
 __all__ = ["assetmap","pkl","cpl","imf","opl","scm"]
 
-import datetime, re, typing, dataclasses
+import datetime, re, typing, dataclasses, uuid, os, queue, threading
 import xml.etree.ElementTree as et
 
+# lxml parses with libxml2 and is considerably faster than the pure-python ElementTree;
+# use it for parsing when available, but don't require it
+try:
+	import lxml.etree as _etree
+	_PARSE_KWARGS = {"remove_comments": True, "remove_pis": True}
+	"""lxml keeps comments and PIs as tree nodes; drop them to match ElementTree"""
+except ImportError:
+	_etree = et
+	_PARSE_KWARGS = {}
+
 PAT_DATE = re.compile(r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})T(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2}(?:\.\d+)?)(?P<timezone>(?:Z)|([\+\-].+))?$", re.I)
 
 @dataclasses.dataclass(frozen=True)
@@ -62,6 +72,12 @@ class Security:
 	@classmethod
 	def from_xml(cls, xml_signer:et.Element, xml_signature:et.Element, ns:typing.Optional[dict]=None) -> "Security":
 		"""Parse the securty from XML"""
+		# lxml elements are not picklable; round-trip them into stdlib
+		# ElementTree nodes so parsed PKLs survive e.g. Pkl.from_paths
+		if not isinstance(xml_signer, et.Element):
+			xml_signer = et.fromstring(_etree.tostring(xml_signer))
+		if not isinstance(xml_signature, et.Element):
+			xml_signature = et.fromstring(_etree.tostring(xml_signature))
 		return cls(
 			signature=xml_signature,
 			signer=xml_signer
@@ -113,6 +129,87 @@ def datetime_to_xsd_datetime(dt:datetime.datetime) -> str:
 
 
 
+_PULL_PARSE_THRESHOLD = 4 * 1024 * 1024
+"""File size in bytes above which `_iter_parse_events` overlaps I/O with parsing"""
+
+_PULL_PARSE_BLOCK = 64 * 1024
+"""Block size in bytes for the background reader used on large files"""
+
+def _iter_parse_events(path) -> typing.Iterator[typing.Tuple[str, et.Element]]:
+	"""Yield `("end", element)` parse events for an XML file
+
+	Small files go straight through `iterparse`. Files larger than
+	`_PULL_PARSE_THRESHOLD` are read in blocks on a background thread and fed
+	to an `XMLPullParser`, so disk reads overlap with parse work.
+	"""
+
+	try:
+		is_large = os.path.getsize(path) > _PULL_PARSE_THRESHOLD
+	except OSError:
+		is_large = False
+
+	if not is_large:
+		yield from _etree.iterparse(path, events=("end",), **_PARSE_KWARGS)
+		return
+
+	parser = _etree.XMLPullParser(events=("end",), **_PARSE_KWARGS)
+	blocks = queue.Queue(maxsize=8)
+	stop = threading.Event()
+	read_errors = []
+
+	def _reader(handle):
+		try:
+			with handle:
+				while not stop.is_set():
+					block = handle.read(_PULL_PARSE_BLOCK)
+					if not block:
+						break
+					blocks.put(block)
+		except Exception as read_error:
+			# Stash the real failure for the consumer; a dying thread would
+			# otherwise surface as a misleading truncated-XML parse error
+			read_errors.append(read_error)
+		finally:
+			# Always unblock the consumer, even if the read fails midway
+			blocks.put(b"")
+
+	reader = threading.Thread(target=_reader, args=(open(path, "rb"),), daemon=True)
+	reader.start()
+
+	try:
+		while True:
+			block = blocks.get()
+			if not block:
+				break
+			parser.feed(block)
+			yield from parser.read_events()
+
+		reader.join()
+		if read_errors:
+			raise read_errors[0]
+		parser.close()
+		yield from parser.read_events()
+	finally:
+		# If the consumer abandons the generator mid-parse (parse error,
+		# generator closed early), the reader may be blocked on a full queue
+		# with the file still open; signal it to stop and drain the queue
+		# until it has exited and closed the file
+		stop.set()
+		while reader.is_alive():
+			try:
+				blocks.get_nowait()
+			except queue.Empty:
+				pass
+			reader.join(timeout=0.01)
+
+def _parse_uuid(urn:str) -> uuid.UUID:
+	"""Parse a UUID from a urn:UUID [RFC 4122] string
+
+	Strips the common `urn:uuid:` prefix up front so `uuid.UUID` can take
+	its fast hex-string path instead of normalizing the URN form itself.
+	"""
+	return uuid.UUID(urn[9:] if urn.startswith("urn:uuid:") else urn)
+
 def xsd_optional_string(xml:typing.Optional[et.Element], default_value:str="") -> typing.Union[str,None]:
 	"""Return a string that may be optionally defined in the XML"""
 	return xml.text if xml is not None else default_value
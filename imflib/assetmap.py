@@ -8,11 +8,23 @@ If multiple volumes are referenced, a `VOLINDEX.xml` file must be present with a
 The assetmap may contain mappings for more than one package.
 """
 
-import dataclasses, typing, datetime, uuid
-import xml.etree.ElementTree as et
-from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, xsd_optional_integer, xsd_optional_bool, UserText
+import dataclasses, typing, datetime, uuid, operator, concurrent.futures
+from imflib import _etree as et
+from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, UserText, _parse_uuid, _iter_parse_events
 
-@dataclasses.dataclass(frozen=True)
+_AM_NS = "http://www.smpte-ra.org/schemas/429-9/2007/AM"
+"""XML namespace for SMPTE 429-9 asset maps"""
+
+_AM = f"{{{_AM_NS}}}"
+"""Clark-notation prefix for fully-qualified asset map tag lookups"""
+
+# Qualified chunk child tags, precomputed for the `Chunk.from_xml` hot loop
+_AM_PATH = _AM + "Path"
+_AM_VOLUME_INDEX = _AM + "VolumeIndex"
+_AM_OFFSET = _AM + "Offset"
+_AM_LENGTH = _AM + "Length"
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class AssetMap:
     """An Asset Map component of an IMF package"""
 
@@ -37,23 +49,72 @@ class AssetMap:
     annotation_text:typing.Optional[UserText] = None
     """Optional description of this asset map"""
 
+    _by_id:typing.Optional[dict] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Lazily-built index of `Asset` s by ID for `get_asset`"""
+
+    _total_size:typing.Any = dataclasses.field(default=False, init=False, repr=False, compare=False)
+    """Cached `total_size`; `False` until first computed, since a valid total may be `None`"""
+
+    _files:typing.Optional[dict] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Lazily-built index of `(Asset, Chunk)` pairs by file path for `files`"""
+
     @classmethod
     def from_file(cls, path:str)->"AssetMap":
-        """Parse an existing AssetMap file"""
-        file_am = et.parse(path)
-        return cls.from_xml(file_am.getroot(),{"":"http://www.smpte-ra.org/schemas/429-9/2007/AM"})
-    
+        """Parse an existing AssetMap file
+
+        The file is parsed incrementally so only one `Asset` subtree is held
+        in memory at a time, rather than the full document tree.
+        """
+        assets = []
+        root = None
+        for _, elem in _iter_parse_events(path):
+            if elem.tag == _AM + "Asset":
+                assets.append(Asset.from_xml(elem))
+                elem.clear()
+            elif elem.tag == _AM + "AssetList":
+                # Drop the already-consumed (cleared) asset shells
+                elem.clear()
+            elif elem.tag == _AM + "AssetMap":
+                root = elem
+
+        return cls(
+            id=_parse_uuid(root.find(_AM+"Id").text),
+            annotation_text=xsd_optional_usertext(root.find(_AM+"AnnotationText")),
+            creator=UserText.from_xml(root.find(_AM+"Creator")),
+            volume_count=int(root.find(_AM+"VolumeCount").text),
+            issue_date=xsd_datetime_to_datetime(root.find(_AM+"IssueDate").text),
+            issuer=UserText.from_xml(root.find(_AM+"Issuer")),
+            assets=assets
+        )
+
+    @classmethod
+    def from_paths(cls, paths:typing.Iterable[str]) -> typing.List["AssetMap"]:
+        """Parse several AssetMap files in parallel
+
+        XML parsing is CPU-bound and holds the GIL, so bulk ingest is farmed
+        out to a process pool. Results are returned in the order of `paths`.
+        """
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            return list(executor.map(cls.from_file, paths, chunksize=8))
+
     @classmethod
     def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"AssetMap":
-        """Parse the AssetMap from XML"""
-        id = uuid.UUID(xml.find("Id",ns).text)
-        creator = UserText.from_xml(xml.find("Creator",ns))
-        issuer = UserText.from_xml(xml.find("Issuer",ns))
-        issue_date = xsd_datetime_to_datetime(xml.find("IssueDate",ns).text)
-        volume_count = int(xml.find("VolumeCount",ns).text)
+        """Parse the AssetMap from XML
+
+        The fully-qualified asset map namespace is assumed; `ns` is accepted
+        only for backwards compatibility and is ignored.
+        """
+        id = _parse_uuid(xml.find(_AM+"Id").text)
+        creator = UserText.from_xml(xml.find(_AM+"Creator"))
+        issuer = UserText.from_xml(xml.find(_AM+"Issuer"))
+        issue_date = xsd_datetime_to_datetime(xml.find(_AM+"IssueDate").text)
+        volume_count = int(xml.find(_AM+"VolumeCount").text)
+
+        annotation_text = xsd_optional_usertext(xml.find(_AM+"AnnotationText"))
 
-        annotation_text = xsd_optional_usertext(xml.find("AnnotationText",ns))
-        assets = [Asset.from_xml(asset,ns) for asset in xml.find("AssetList",ns)]
+        # The tag check skips comments and PIs, which lxml keeps as nodes
+        # (with non-string tags) when the tree was parsed by the caller
+        assets = [Asset.from_xml(asset) for asset in xml.find(_AM+"AssetList") if isinstance(asset.tag, str)]
 
         return cls(
             id=id,
@@ -68,7 +129,8 @@ class AssetMap:
     @property
     def packing_lists(self)->typing.List["Asset"]:
         """A list of packing lists in this package"""
-        return [asset for asset in self.assets if asset.is_packing_list]
+        # filter/attrgetter run the per-asset step in C rather than bytecode
+        return list(filter(operator.attrgetter("is_packing_list"), self.assets))
     
     @property
     def total_size(self)->int:
@@ -76,20 +138,41 @@ class AssetMap:
         # TODO: "If the Length parameter is absent, the length of the chunk shall be that of the asset as expressed by the respective Packing List."
         # This allows cases where some chunks may be defined and some may not, thus asset.total_size may be None or throw an exception depending on how I handle that.
         # Think about this further.
-        asset_sizes = [asset.total_size for asset in self.assets]
-        if None in asset_sizes:
-            return None
-        return sum(asset_sizes)
+        if self._total_size is False:
+            total = 0
+            for asset in self.assets:
+                size = asset.total_size
+                if size is None:
+                    total = None
+                    break
+                total += size
+            object.__setattr__(self, "_total_size", total)
+        return self._total_size
 
     def get_asset(self, id:str) -> "Asset":
         """Get an Asset from the AssetMap based on the URN ID"""
-        for asset in self.assets:
-            if asset.id == id: return asset        
-        return None
+        if self._by_id is None:
+            object.__setattr__(self, "_by_id", {asset.id: asset for asset in self.assets})
+        return self._by_id.get(id)
+
+    @property
+    def files(self)->typing.Dict[str, typing.Tuple["Asset","Chunk"]]:
+        """Mapping of each mapped file path to its `(Asset, Chunk)` pair
+
+        Built once on first access so reverse lookups (which asset owns a
+        given file on disk) are O(1) instead of a scan over every chunk.
+        """
+        if self._files is None:
+            files = {}
+            for asset in self.assets:
+                for chunk in asset.chunks:
+                    files[chunk.file_path] = (asset, chunk)
+            object.__setattr__(self, "_files", files)
+        return self._files
 
 # TODO: Per SMPTE 0429-9-2014 update, "The VolumeIndex structure is not used."
 # However, some example IMFs seem to include a VOLINDEX.  Research further.
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class VolumeIndex:
     """A `VolumeIndex` file required only in multi-volume packages"""
 
@@ -100,17 +183,17 @@ class VolumeIndex:
     def from_file(cls, path:str)->"VolumeIndex":
         """Parse an existing VolumeIndex file"""
         file_am = et.parse(path)
-        return cls.from_xml(file_am.getroot(),{"":"http://www.smpte-ra.org/schemas/429-9/2007/AM"})
-    
+        return cls.from_xml(file_am.getroot())
+
     @classmethod
     def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"AssetMap":
         """Parse the AssetMap from XML"""
         return cls(
-            index = int(xml.find("Index",ns).text)
+            index = int(xml.find(_AM+"Index").text)
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Asset:
     """An Asset as defined in an IMF AssetMap"""
 
@@ -127,15 +210,29 @@ class Asset:
     annotation_text:typing.Optional[UserText] = None
     """Optional description of this asset"""
 
+    _total_size:typing.Any = dataclasses.field(default=False, init=False, repr=False, compare=False)
+    """Cached `total_size`; `False` until first computed, since a valid total may be `None`"""
+
+    _file_paths:typing.Optional[tuple] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Cached `file_paths`"""
+
     @classmethod
     def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Asset":
         """Parse an Asset from an AssetList XML Element"""
-        
-        id = uuid.UUID(xml.find("Id", ns).text)
-        chunks = [Chunk.from_xml(chunk, ns) for chunk in xml.find("ChunkList",ns)]
 
-        is_packing_list = xsd_optional_bool(xml.find("PackingList",ns))
-        annotation_text = xsd_optional_usertext(xml.find("AnnotationText", ns))
+        id = _parse_uuid(xml.find(_AM+"Id").text)
+
+        # The tag check skips comments and PIs, which lxml keeps as nodes
+        # (with non-string tags) when the tree was parsed by the caller
+        chunks = [Chunk.from_xml(chunk) for chunk in xml.find(_AM+"ChunkList") if isinstance(chunk.tag, str)]
+
+        # None checks inlined rather than routed through the xsd_optional_*
+        # helpers; this runs once per asset and the calls add up
+        xml_packing_list = xml.find(_AM+"PackingList")
+        is_packing_list = xml_packing_list is not None and xml_packing_list.text in ("true","1")
+
+        xml_annotation_text = xml.find(_AM+"AnnotationText")
+        annotation_text = UserText.from_xml(xml_annotation_text) if xml_annotation_text is not None else None
 
         return cls(
             id=id,
@@ -150,17 +247,27 @@ class Asset:
         # TODO: "If the Length parameter is absent, the length of the chunk shall be that of the asset as expressed by the respective Packing List."
         # This allows cases where some chunks may be defined and some may not.
         # Think about this further.
-        chunk_sizes = [chunk.size for chunk in self.chunks]
-        if None in chunk_sizes:
-            return None
-        return sum(chunk_sizes)
+        if self._total_size is False:
+            total = 0
+            for chunk in self.chunks:
+                if chunk.size is None:
+                    total = None
+                    break
+                total += chunk.size
+            object.__setattr__(self, "_total_size", total)
+        return self._total_size
     
     @property
-    def file_paths(self)->typing.List[str]:
+    def file_paths(self)->typing.Tuple[str, ...]:
         """All file paths associated with this asset"""
-        return [chunk.file_path for chunk in self.chunks]
-
-@dataclasses.dataclass(frozen=True)
+        if self._file_paths is None:
+            # map/attrgetter run the per-chunk step in C rather than bytecode
+            object.__setattr__(self, "_file_paths", tuple(map(operator.attrgetter("file_path"), self.chunks)))
+        return self._file_paths
+
+# Not frozen: chunks are constructed in bulk during parsing, and frozen's
+# generated __init__ pays an object.__setattr__ call per field
+@dataclasses.dataclass(slots=True)
 class Chunk:
     """A chunk of an Asset"""
 
@@ -181,11 +288,31 @@ class Chunk:
     def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Chunk":
         """Parse a chunk of an Asset from a ChunkList"""
 
-        file_path = xml.find("Path",ns).text
-        volume_index = xsd_optional_integer(xml.find("VolumeIndex",ns), 1)
-        offset = xsd_optional_integer(xml.find("Offset",ns),0)
-        size = xsd_optional_integer(xml.find("Length",ns), None)
-        
+        file_path = None
+        volume_index = 1
+        offset = 0
+        size = None
+
+        # A single pass over the children beats one find() scan per field;
+        # SMPTE 429-9 allows each of these elements at most once per chunk
+        for child in xml:
+            tag = child.tag
+            if not isinstance(tag, str):
+                # Comments and PIs, which lxml keeps as nodes with non-string tags
+                continue
+            if tag == _AM_PATH:
+                file_path = child.text
+            elif tag == _AM_VOLUME_INDEX:
+                volume_index = int(child.text)
+            elif tag == _AM_OFFSET:
+                offset = int(child.text)
+            elif tag == _AM_LENGTH:
+                size = int(child.text)
+
+        # Path is the one required chunk element per SMPTE 429-9
+        if file_path is None:
+            raise ValueError("Chunk is missing its required Path element")
+
         return cls(
             file_path=file_path,
             volume_index=volume_index,
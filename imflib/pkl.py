@@ -1,12 +1,21 @@
 # Based on SMPTE 429-8-2007: https://ieeexplore.ieee.org/document/7290849
 # With additions from SMPTE 2067-2-2020: https://ieeexplore.ieee.org/document/9097478
 
-import dataclasses, typing, datetime, uuid
-import xml.etree.ElementTree as et
-from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, xsd_optional_security
+import dataclasses, typing, datetime, uuid, sys, concurrent.futures
+from imflib import _etree as et
+from imflib import xsd_datetime_to_datetime, xsd_optional_usertext, xsd_optional_security, _parse_uuid, _iter_parse_events
 from imflib import UserText, Security
 
-@dataclasses.dataclass(frozen=True)
+_PKL_NS = "http://www.smpte-ra.org/schemas/2067-2/2016/PKL"
+"""XML namespace for SMPTE 2067-2 packing lists"""
+
+_PKL = f"{{{_PKL_NS}}}"
+"""Clark-notation prefix for fully-qualified packing list tag lookups"""
+
+_DS = "{http://www.w3.org/2000/09/xmldsig#}"
+"""Clark-notation prefix for XML digital signature tag lookups"""
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Asset:
     """An asset packed into this IMF package"""
 
@@ -32,19 +41,31 @@ class Asset:
     """Optional description of the asset"""
 
     @classmethod
-    def from_xml(cls, xml:et.Element, ns:typing.Dict) -> "Asset":
-        """Create an asset from an XML element"""
+    def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None) -> "Asset":
+        """Create an asset from an XML element
+
+        The fully-qualified packing list namespace is assumed; `ns` is
+        accepted only for backwards compatibility and is ignored.
+        """
+
+        id = _parse_uuid(xml.find(_PKL+"Id").text)
+        size = int(xml.find(_PKL+"Size").text)
+
+        # The MIME type and digest name repeat across most assets in a package,
+        # so intern them to share one string object per distinct value
+        type = sys.intern(xml.find(_PKL+"Type").text)
 
-        id = uuid.UUID(xml.find("Id", ns).text)
-        size = int(xml.find("Size", ns).text)
-        type = xml.find("Type", ns).text
-        
         # As of 2067-2-2020, http://www.w3.org/2000/09/xmldsig#sha1 is the only supported algorithm
-        hash = xml.find("Hash", ns).text
-        hash_algorithm = xml.find("HashAlgorithm", ns).attrib.get("Algorithm").split("#")[-1]
-        
-        original_file_name = xsd_optional_usertext(xml.find("OriginalFileName", ns))
-        annotation_text = xsd_optional_usertext(xml.find("AnnotationText", ns))
+        hash = xml.find(_PKL+"Hash").text
+        hash_algorithm = sys.intern(xml.find(_PKL+"HashAlgorithm").attrib.get("Algorithm").split("#")[-1])
+
+        # None checks inlined rather than routed through the xsd_optional_*
+        # helpers; this runs once per asset and the calls add up
+        xml_original_file_name = xml.find(_PKL+"OriginalFileName")
+        original_file_name = UserText.from_xml(xml_original_file_name) if xml_original_file_name is not None else None
+
+        xml_annotation_text = xml.find(_PKL+"AnnotationText")
+        annotation_text = UserText.from_xml(xml_annotation_text) if xml_annotation_text is not None else None
         
         return cls(
             id=id,
@@ -65,7 +86,7 @@ class Asset:
         # TODO: Add mime-type guessing via `mimetypes` module? Or maybe nah.
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Pkl:
     """An IMF PKL Packing List"""
 
@@ -99,35 +120,87 @@ class Pkl:
     security:typing.Optional[Security]=None
     """Optional digital signer and signature authenticating the PKL"""
 
+    _by_id:typing.Optional[dict] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Lazily-built index of `Asset` s by ID for `get_asset`"""
+
+    _total_size:typing.Optional[int] = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Cached `total_size`"""
+
 
     @classmethod
     def from_file(cls, path:str) -> "Pkl":
-        """Parse an existing PKL from a given file path"""
+        """Parse an existing PKL from a given file path
+
+        The file is parsed incrementally so only one `Asset` subtree is held
+        in memory at a time, rather than the full document tree.
+        """
+        assets = []
+        root = None
+        for _, elem in _iter_parse_events(path):
+            if elem.tag == _PKL + "Asset":
+                assets.append(Asset.from_xml(elem))
+                elem.clear()
+            elif elem.tag == _PKL + "AssetList":
+                # Drop the already-consumed (cleared) asset shells
+                elem.clear()
+            elif elem.tag == _PKL + "PackingList":
+                root = elem
+
+        xml_group_id = root.find(_PKL+"GroupId")
+        xml_icon_id = root.find(_PKL+"IconId")
 
-        file_pkl = et.parse(path)
-        return cls.from_xml(file_pkl.getroot(), {"":"http://www.smpte-ra.org/schemas/2067-2/2016/PKL"})
+        return cls(
+            id=_parse_uuid(root.find(_PKL+"Id").text),
+            issuer=UserText.from_xml(root.find(_PKL+"Issuer")),
+            creator=UserText.from_xml(root.find(_PKL+"Creator")),
+            issue_date=xsd_datetime_to_datetime(root.find(_PKL+"IssueDate").text),
+            assets=assets,
+            annotation_text=xsd_optional_usertext(root.find(_PKL+"AnnotationText")),
+            group_id=_parse_uuid(xml_group_id.text) if xml_group_id is not None else None,
+            icon_id=_parse_uuid(xml_icon_id.text) if xml_icon_id is not None else None,
+            security=xsd_optional_security(
+                xml_signer=root.find(_PKL+"Signer"),
+                xml_signature=root.find(_DS+"Signature")
+            )
+        )
     
+    @classmethod
+    def from_paths(cls, paths:typing.Iterable[str]) -> typing.List["Pkl"]:
+        """Parse several PKL files in parallel
+
+        XML parsing is CPU-bound and holds the GIL, so bulk ingest is farmed
+        out to a process pool. Results are returned in the order of `paths`.
+        """
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            return list(executor.map(cls.from_file, paths, chunksize=8))
+
     @classmethod
     def from_xml(cls, xml:et.Element, ns:typing.Optional[dict]=None)->"Pkl":
-        """Parse a PKL from XML"""
+        """Parse a PKL from XML
 
-        print(xml.tag)
+        The fully-qualified packing list namespace is assumed; `ns` is
+        accepted only for backwards compatibility and is ignored.
+        """
 
-        id = uuid.UUID(xml.find("Id", ns).text)
-        issuer = UserText.from_xml(xml.find("Issuer", ns))
-        creator = UserText.from_xml(xml.find("Creator", ns))
-        issue_date = xsd_datetime_to_datetime(xml.find("IssueDate",ns).text)
+        id = _parse_uuid(xml.find(_PKL+"Id").text)
+        issuer = UserText.from_xml(xml.find(_PKL+"Issuer"))
+        creator = UserText.from_xml(xml.find(_PKL+"Creator"))
+        issue_date = xsd_datetime_to_datetime(xml.find(_PKL+"IssueDate").text)
 
         # TODO: Iterator...?
-        assets = [Asset.from_xml(asset,ns) for asset in xml.findall("AssetList/Asset",ns)]
+        assets = [Asset.from_xml(asset) for asset in xml.findall(_PKL+"AssetList/"+_PKL+"Asset")]
+
+        annotation_text = xsd_optional_usertext(xml.find(_PKL+"AnnotationText"))
+
+        xml_group_id = xml.find(_PKL+"GroupId")
+        group_id = _parse_uuid(xml_group_id.text) if xml_group_id is not None else None
 
-        annotation_text = xsd_optional_usertext(xml.find("AnnotationText", ns))
-        group_id = uuid.UUID(xml.find("GroupId", ns)) if xml.find("GroupId", ns) is not None else None
-        icon_id = uuid.UUID(xml.find("IconId", ns)) if xml.find("IconId", ns) is not None else None
+        xml_icon_id = xml.find(_PKL+"IconId")
+        icon_id = _parse_uuid(xml_icon_id.text) if xml_icon_id is not None else None
 
         security = xsd_optional_security(
-            xml_signer=xml.find("Signer",ns),
-            xml_signature=xml.find("ds:Signature",{"ds":"http://www.w3.org/2000/09/xmldsig#"})
+            xml_signer=xml.find(_PKL+"Signer"),
+            xml_signature=xml.find(_DS+"Signature")
         )
 
         return cls(
@@ -144,11 +217,16 @@ class Pkl:
     
     def get_asset(self, id:str) -> "Asset":
         """Get an Asset from the PKL based on the URN ID"""
-        for asset in self.assets:
-            if asset.id == id: return asset        
-        return None
+        if self._by_id is None:
+            object.__setattr__(self, "_by_id", {asset.id: asset for asset in self.assets})
+        return self._by_id.get(id)
     
     @property
     def total_size(self)->int:
         """Total size of assets in bytes"""
-        return sum(a.size for a in self.assets)
+        if self._total_size is None:
+            total = 0
+            for asset in self.assets:
+                total += asset.size
+            object.__setattr__(self, "_total_size", total)
+        return self._total_size
@@ -4,4 +4,7 @@ setuptools.setup(
 	name="imflib",
 	version="0.1",
 	packages=["imflib"],
+	# slots=True dataclasses need 3.10; pickling the frozen slotted
+	# dataclasses for from_paths needs 3.11
+	python_requires=">=3.11",
 )
\ No newline at end of file